@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import ChainMap
 from dataclasses import dataclass
 import logging
 from typing import Any
@@ -10,6 +11,11 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
+try:
+    from homeassistant.components.modbus import get_hub
+except ImportError:
+    get_hub = None
+
 from .const import (
     CONF_HUB,
     CONF_SCAN_INTERVAL,
@@ -21,6 +27,7 @@ from .const import (
     PLATFORMS,
 )
 from .coordinator import BWWPDataUpdateCoordinator, BWWPSharedModbusHub
+from .entity import pop_cached_device_info
 LOGGER = logging.getLogger(__name__)
 
 
@@ -30,26 +37,28 @@ class RuntimeData:
 
     hub: Any
     coordinator: BWWPDataUpdateCoordinator
+    resolved_hub_name: str
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up BWWP from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
+
+    # Options take precedence over the original entry data.
+    cfg = ChainMap(entry.options, entry.data)
 
-    hub_name = str(_entry_value(entry, CONF_HUB, DEFAULT_HUB)).strip()
+    hub_name = str(cfg.get(CONF_HUB, DEFAULT_HUB)).strip()
     if not hub_name:
         raise ConfigEntryNotReady(
             "No Modbus hub configured. Set a hub name in integration options."
         )
 
-    slave_id = int(_entry_value(entry, CONF_SLAVE_ID, DEFAULT_SLAVE_ID))
-    scan_interval = int(
-        _entry_value(entry, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
-    )
+    slave_id = int(cfg.get(CONF_SLAVE_ID, DEFAULT_SLAVE_ID))
+    scan_interval = int(cfg.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
 
+    if get_hub is None:
+        raise ConfigEntryNotReady("Modbus integration is not available")
     try:
-        from homeassistant.components.modbus import get_hub
-
         modbus_hub = get_hub(hass, hub_name)
     except Exception as err:
         raise ConfigEntryNotReady(
@@ -63,12 +72,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hub=hub,
         scan_interval_seconds=scan_interval,
     )
-    hass.data[DOMAIN][entry.entry_id] = RuntimeData(hub=hub, coordinator=coordinator)
+    hass.data[DOMAIN][entry.entry_id] = RuntimeData(
+        hub=hub, coordinator=coordinator, resolved_hub_name=hub_name
+    )
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    # Do not block Home Assistant startup on first Modbus poll.
-    hass.async_create_task(coordinator.async_refresh())
+    # Do not block Home Assistant startup on first Modbus poll; the task is
+    # bound to the entry so unloading cancels an in-flight first refresh.
+    entry.async_create_task(hass, coordinator.async_refresh())
     return True
 
 
@@ -78,20 +90,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not unload_ok:
         return False
 
-    runtime: RuntimeData = hass.data[DOMAIN].pop(entry.entry_id)
+    domain_data = hass.data[DOMAIN]
+    runtime: RuntimeData = domain_data.pop(entry.entry_id)
+    pop_cached_device_info(entry.entry_id)
     await runtime.hub.async_close()
 
-    if not hass.data[DOMAIN]:
-        hass.data.pop(DOMAIN)
+    if not domain_data:
+        hass.data.pop(DOMAIN, None)
 
     return True
 
 
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload entry when options change."""
+    # Options may rename the device; force a fresh device-info lookup.
+    pop_cached_device_info(entry.entry_id)
     await hass.config_entries.async_reload(entry.entry_id)
-
-
-def _entry_value(entry: ConfigEntry, key: str, default=None):
-    """Read key from options first, then fallback to entry data."""
-    return entry.options.get(key, entry.data.get(key, default))
@@ -13,17 +13,20 @@ from homeassistant.util import dt as dt_util
 
 from . import RuntimeData
 from .const import DOMAIN
+from .coordinator import NonRetryableModbusException
 from .entity import BWWPBaseEntity
 
-WRITE_REFRESH_DELAY_SECONDS = 0.2
+# Writes go through the coordinator-backed hub with its own locking;
+# no per-platform update serialization needed.
+PARALLEL_UPDATES = 0
 
 
 @dataclass(frozen=True, kw_only=True)
 class BWWPButtonDescription(ButtonEntityDescription):
     """Description for one BWWP button action."""
 
-    hour_register: int
-    minute_register: int
+    # First register of the contiguous [minute, hour] clock pair.
+    base_register: int
 
 
 BUTTON_DESCRIPTIONS: tuple[BWWPButtonDescription, ...] = (
@@ -32,8 +35,7 @@ BUTTON_DESCRIPTIONS: tuple[BWWPButtonDescription, ...] = (
         translation_key="sync_device_clock",
         icon="mdi:clock-sync",
         entity_category=EntityCategory.CONFIG,
-        hour_register=105,
-        minute_register=104,
+        base_register=104,
     ),
 )
 
@@ -46,7 +48,7 @@ async def async_setup_entry(
     """Set up BWWP button entities."""
     runtime: RuntimeData = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        BWWPButton(runtime, entry, description) for description in BUTTON_DESCRIPTIONS
+        [BWWPButton(runtime, entry, description) for description in BUTTON_DESCRIPTIONS]
     )
 
 
@@ -61,18 +63,44 @@ class BWWPButton(BWWPBaseEntity, ButtonEntity):
         entry: ConfigEntry,
         description: BWWPButtonDescription,
     ) -> None:
-        super().__init__(runtime.coordinator, entry, description.key)
+        super().__init__(
+            runtime.coordinator,
+            entry,
+            description.key,
+            state_keys=("current_h", "current_min"),
+        )
         self.entity_description = description
         self._hub = runtime.hub
+        # Frozen-dataclass attribute access is two lookups; cache the
+        # register once since it never changes.
+        self._base_register = description.base_register
 
     async def async_press(self) -> None:
         now = dt_util.now()
-        await self._hub.async_write_register(
-            address=self.entity_description.hour_register,
-            value=int(now.hour),
-        )
-        await self._hub.async_write_register(
-            address=self.entity_description.minute_register,
-            value=int(now.minute),
-        )
-        self._schedule_background_refresh(WRITE_REFRESH_DELAY_SECONDS)
+        data = self.coordinator.data or {}
+        try:
+            cached = (int(data["current_h"]), int(data["current_min"]))
+        except (KeyError, TypeError, ValueError):
+            cached = None
+        if cached == (now.hour, now.minute):
+            # Device clock already matches to the minute; skip the write
+            # and the follow-up refresh entirely.
+            return
+
+        base_register = self._base_register
+        values = [int(now.minute), int(now.hour)]
+        try:
+            # Minute and hour registers are adjacent, so one FC16 request
+            # syncs the clock in a single Modbus transaction.
+            await self._hub.async_write_registers(
+                address=base_register,
+                values=values,
+            )
+        except NonRetryableModbusException:
+            # Some gateways reject FC16; fall back to two single writes.
+            for offset, value in enumerate(values):
+                await self._hub.async_write_register(
+                    address=base_register + offset,
+                    value=value,
+                )
+        self._schedule_background_refresh()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import logging
 from typing import Any
 
@@ -11,6 +12,11 @@ from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import selector
 
+try:
+    from homeassistant.components.modbus import get_hub
+except ImportError:
+    get_hub = None
+
 from .const import (
     CONF_HUB,
     CONF_NAME,
@@ -42,35 +48,71 @@ def _number_box(
     )
 
 
+# Selector objects are immutable; build them once at import.
+_SLAVE_ID_SELECTOR = _number_box(min_value=1, max_value=247, step=1)
+_SCAN_INTERVAL_SELECTOR = _number_box(min_value=1, max_value=3600, step=1)
+
+
 def _with_legacy_defaults(defaults: dict[str, Any]) -> dict[str, Any]:
-    """Map old options/data to current defaults where possible."""
+    """Map old options/data to current defaults where possible.
+
+    Returns the caller's dict unchanged (not a copy) when no legacy
+    migration is needed; callers must not rely on getting a fresh dict.
+    """
+    legacy_hub = defaults.get(LEGACY_CONF_HUB)
+    if defaults.get(CONF_HUB) or not legacy_hub:
+        return defaults
     merged = dict(defaults)
-    legacy_hub = merged.get(LEGACY_CONF_HUB)
-    if not merged.get(CONF_HUB) and legacy_hub:
-        merged[CONF_HUB] = str(legacy_hub)
+    merged[CONF_HUB] = str(legacy_hub)
     return merged
 
 
-def _build_schema(defaults: dict[str, Any]) -> vol.Schema:
+@lru_cache(maxsize=8)
+def _cached_schema(
+    name: str, hub: str, slave_id: int, scan_interval: int
+) -> vol.Schema:
+    """Build (or return a cached) schema with the given defaults."""
     return vol.Schema(
         {
-            vol.Required(CONF_NAME, default=defaults.get(CONF_NAME, DEFAULT_NAME)): str,
-            vol.Required(CONF_HUB, default=defaults.get(CONF_HUB, DEFAULT_HUB)): str,
-            vol.Required(
-                CONF_SLAVE_ID, default=defaults.get(CONF_SLAVE_ID, DEFAULT_SLAVE_ID)
-            ): _number_box(min_value=1, max_value=247, step=1),
+            vol.Required(CONF_NAME, default=name): str,
+            vol.Required(CONF_HUB, default=hub): str,
+            vol.Required(CONF_SLAVE_ID, default=slave_id): _SLAVE_ID_SELECTOR,
             vol.Required(
-                CONF_SCAN_INTERVAL,
-                default=defaults.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-            ): _number_box(min_value=1, max_value=3600, step=1),
+                CONF_SCAN_INTERVAL, default=scan_interval
+            ): _SCAN_INTERVAL_SELECTOR,
         }
     )
 
 
+# (key, fallback, normalizer) per schema field, walked once per build so
+# each default is a single dict probe.
+_SCHEMA_FIELDS = (
+    (CONF_NAME, DEFAULT_NAME, str),
+    (CONF_HUB, DEFAULT_HUB, str),
+    (CONF_SLAVE_ID, DEFAULT_SLAVE_ID, int),
+    (CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, int),
+)
+
+
+def _build_schema(defaults: dict[str, Any]) -> vol.Schema:
+    return _cached_schema(
+        *(
+            normalize(defaults.get(key, fallback))
+            for key, fallback, normalize in _SCHEMA_FIELDS
+        )
+    )
+
+
+# Schema for a pristine form; built once since defaults-free renders are
+# the common case and voluptuous schema construction is not free.
+_EMPTY_SCHEMA = _build_schema({})
+
+
 def _normalize_user_input(user_input: dict[str, Any]) -> dict[str, Any]:
     """Cast selector values into the expected runtime types."""
+    # Build only the keys the entry actually stores; no spread-copy of
+    # the submitted form dict.
     return {
-        **user_input,
         CONF_NAME: str(user_input[CONF_NAME]).strip(),
         CONF_HUB: str(user_input[CONF_HUB]).strip(),
         CONF_SLAVE_ID: int(user_input[CONF_SLAVE_ID]),
@@ -80,15 +122,18 @@ def _normalize_user_input(user_input: dict[str, Any]) -> dict[str, Any]:
 
 async def _async_validate_hub_exists(hass, hub_name: str) -> None:
     """Validate that the named Home Assistant Modbus hub exists."""
-    if not hub_name:
+    if not hub_name or get_hub is None:
         raise HubNotFound
 
     try:
-        from homeassistant.components.modbus import get_hub
-
         get_hub(hass, hub_name)
-    except Exception as err:
-        LOGGER.debug("Configured modbus hub '%s' not found: %s", hub_name, err)
+    except KeyError as err:
+        # get_hub only fails with a missing-name lookup; anything else is
+        # a programming error and should surface to the outer handler.
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Configured modbus hub '%s' not found: %s", hub_name, err
+            )
         raise HubNotFound from err
 
 
@@ -117,7 +162,9 @@ class BWWPConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
             else:
                 await self.async_set_unique_id(
-                    f"{user_input[CONF_HUB]}:{user_input[CONF_SLAVE_ID]}"
+                    ":".join(
+                        (user_input[CONF_HUB], str(user_input[CONF_SLAVE_ID]))
+                    )
                 )
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(
@@ -127,7 +174,7 @@ class BWWPConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         defaults = _with_legacy_defaults(user_input or {})
         return self.async_show_form(
             step_id="user",
-            data_schema=_build_schema(defaults),
+            data_schema=_build_schema(defaults) if defaults else _EMPTY_SCHEMA,
             errors=errors,
         )
 
@@ -142,13 +189,28 @@ class BWWPOptionsFlow(config_entries.OptionsFlow):
 
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         self._config_entry = config_entry
+        self._schema: vol.Schema | None = None
+        self._hub_name_cache: str | None = None
+
+    def _current_hub_name(self) -> str:
+        """Hub name currently in effect for this entry (cached per flow)."""
+        if self._hub_name_cache is None:
+            defaults = {**self._config_entry.data, **self._config_entry.options}
+            defaults = _with_legacy_defaults(defaults)
+            self._hub_name_cache = str(defaults.get(CONF_HUB, DEFAULT_HUB)).strip()
+        return self._hub_name_cache
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
         errors: dict[str, str] = {}
 
         if user_input is not None:
             try:
-                user_input = await _async_validate_input(self.hass, user_input)
+                cleaned = _normalize_user_input(user_input)
+                # Only re-validate the hub when its name actually changed;
+                # saving e.g. a new poll interval needs no hub lookup.
+                if cleaned[CONF_HUB] != self._current_hub_name():
+                    await _async_validate_hub_exists(self.hass, cleaned[CONF_HUB])
+                user_input = cleaned
             except HubNotFound:
                 errors["base"] = "hub_not_found"
             except Exception:
@@ -157,14 +219,19 @@ class BWWPOptionsFlow(config_entries.OptionsFlow):
             else:
                 return self.async_create_entry(title="", data=user_input)
 
-        defaults = {**self._config_entry.data, **self._config_entry.options}
-        defaults = _with_legacy_defaults(defaults)
+        # Entry data/options cannot change mid-flow, so the schema is
+        # built once per flow and reused across error re-renders.
+        if self._schema is None:
+            defaults = {**self._config_entry.data, **self._config_entry.options}
+            self._schema = _build_schema(_with_legacy_defaults(defaults))
         return self.async_show_form(
             step_id="init",
-            data_schema=_build_schema(defaults),
+            data_schema=self._schema,
             errors=errors,
         )
 
 
 class HubNotFound(HomeAssistantError):
     """Error to indicate configured modbus hub does not exist."""
+
+    __slots__ = ()
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Final, Literal
+from typing import Final, Literal, NamedTuple
 
 from homeassistant.const import Platform
 
@@ -31,37 +30,47 @@ PLATFORMS: Final = [
 RegisterType = Literal["holding", "input"]
 
 
-@dataclass(frozen=True)
-class RegisterDefinition:
-    """Definition of one Modbus register."""
+class RegisterDefinition(NamedTuple):
+    """Definition of one Modbus register.
+
+    ``poll_every`` is the register's polling cadence: 1 means every
+    update cycle, N means only every Nth cycle. Configuration values
+    that only change on user input do not need the sensor poll rate.
+    """
 
     key: str
     address: int
     register_type: RegisterType
     scale: float = 1.0
     precision: int | None = None
+    poll_every: int = 1
+
+
+# Cadence for slow-moving configuration registers; with the default
+# 30 s scan interval an external change still shows within 2.5 min.
+SLOW_POLL_EVERY: Final = 5
 
 
 READ_REGISTERS: Final[tuple[RegisterDefinition, ...]] = (
-    RegisterDefinition("t_setpoint", 4, "holding"),
-    RegisterDefinition("t_min", 5, "holding"),
-    RegisterDefinition("t2_min", 6, "holding"),
-    RegisterDefinition("timer_raw", 7, "holding"),
-    RegisterDefinition("start_h", 8, "holding"),
-    RegisterDefinition("start_min", 9, "holding"),
-    RegisterDefinition("stop_h", 10, "holding"),
-    RegisterDefinition("stop_min", 11, "holding"),
-    RegisterDefinition("betriebsart_raw", 12, "holding"),
-    RegisterDefinition("legio_raw", 13, "holding"),
-    RegisterDefinition("ventilator_raw", 15, "holding"),
-    RegisterDefinition("pv_modus_raw", 17, "holding"),
-    RegisterDefinition("t_pv_wp", 18, "holding"),
-    RegisterDefinition("t_pv_el", 19, "holding"),
-    RegisterDefinition("holiday_raw", 20, "holding"),
-    RegisterDefinition("abwesenheits_tage", 21, "holding"),
-    RegisterDefinition("boost_raw", 22, "holding"),
-    RegisterDefinition("t_max", 28, "holding"),
-    RegisterDefinition("legionellen_tage", 33, "holding"),
+    RegisterDefinition("t_setpoint", 4, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("t_min", 5, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("t2_min", 6, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("timer_raw", 7, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("start_h", 8, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("start_min", 9, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("stop_h", 10, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("stop_min", 11, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("betriebsart_raw", 12, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("legio_raw", 13, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("ventilator_raw", 15, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("pv_modus_raw", 17, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("t_pv_wp", 18, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("t_pv_el", 19, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("holiday_raw", 20, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("abwesenheits_tage", 21, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("boost_raw", 22, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("t_max", 28, "holding", poll_every=SLOW_POLL_EVERY),
+    RegisterDefinition("legionellen_tage", 33, "holding", poll_every=SLOW_POLL_EVERY),
     RegisterDefinition("current_min", 104, "holding"),
     RegisterDefinition("current_h", 105, "holding"),
     RegisterDefinition("t1", 7, "input", scale=0.1, precision=1),
@@ -71,6 +80,19 @@ READ_REGISTERS: Final[tuple[RegisterDefinition, ...]] = (
     RegisterDefinition("status_raw", 16, "input"),
 )
 
+# Read definitions grouped by register type, frozen at import time so the
+# coordinator never has to sort or group per poll. Addresses are sorted
+# ascending within each register type.
+SORTED_READ_REGISTERS: Final[dict[RegisterType, tuple[RegisterDefinition, ...]]] = {
+    register_type: tuple(
+        sorted(
+            (r for r in READ_REGISTERS if r.register_type == register_type),
+            key=lambda r: r.address,
+        )
+    )
+    for register_type in ("holding", "input")
+}
+
 TIMER_OPTIONS: Final[dict[int, str]] = {
     0: "Aus",
     1: "An",
@@ -113,6 +135,25 @@ VENTILATOR_OPTIONS: Final[dict[int, str]] = {
     3: "Stufe 3",
 }
 
+# Label tuples and label->code reverse maps for the writable enum
+# registers, derived once here so the select platform imports pure data.
+BETRIEBSART_OPTIONS_LABELS: Final = tuple(BETRIEBSART_OPTIONS.values())
+BETRIEBSART_OPTIONS_REV: Final[dict[str, int]] = {
+    label: code for code, label in BETRIEBSART_OPTIONS.items()
+}
+LEGIONELLEN_OPTIONS_LABELS: Final = tuple(LEGIONELLEN_OPTIONS.values())
+LEGIONELLEN_OPTIONS_REV: Final[dict[str, int]] = {
+    label: code for code, label in LEGIONELLEN_OPTIONS.items()
+}
+PV_MODUS_OPTIONS_LABELS: Final = tuple(PV_MODUS_OPTIONS.values())
+PV_MODUS_OPTIONS_REV: Final[dict[str, int]] = {
+    label: code for code, label in PV_MODUS_OPTIONS.items()
+}
+FERIEN_OPTIONS_LABELS: Final = tuple(FERIEN_OPTIONS.values())
+FERIEN_OPTIONS_REV: Final[dict[str, int]] = {
+    label: code for code, label in FERIEN_OPTIONS.items()
+}
+
 ENUM_MAPPINGS: Final[dict[str, dict[int, str]]] = {
     "timer": TIMER_OPTIONS,
     "betriebsart": BETRIEBSART_OPTIONS,
@@ -125,6 +166,13 @@ ENUM_MAPPINGS: Final[dict[str, dict[int, str]]] = {
     "boost": AN_AUS_OPTIONS,
 }
 
+# Raw enum codes are small and contiguous, so each mapping flattens into a
+# tuple indexed by the raw value; decode becomes an index instead of a hash.
+ENUM_TABLES: Final[dict[str, tuple[str | None, ...]]] = {
+    enum_key: tuple(mapping.get(code) for code in range(max(mapping) + 1))
+    for enum_key, mapping in ENUM_MAPPINGS.items()
+}
+
 ENUM_SOURCE_KEYS: Final[dict[str, str]] = {
     "timer": "timer_raw",
     "betriebsart": "betriebsart_raw",
@@ -136,3 +184,12 @@ ENUM_SOURCE_KEYS: Final[dict[str, str]] = {
     "ventilator": "ventilator_raw",
     "boost": "boost_raw",
 }
+
+# Raw register keys each derived state key is computed from; used to
+# translate an entity's state keys into the registers it actually
+# needs so the coordinator can skip registers nobody listens to.
+DERIVED_SOURCE_KEYS: Final[dict[str, tuple[str, ...]]] = {
+    "betriebsstatus": ("kompressor_raw", "heizstab_raw"),
+    "device_time": ("current_h", "current_min"),
+    **{enum_key: (source,) for enum_key, source in ENUM_SOURCE_KEYS.items()},
+}
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
+import socket
 from datetime import timedelta
 from typing import Any, TYPE_CHECKING
 
@@ -11,19 +13,33 @@ from homeassistant.components.modbus.const import (
     CALL_TYPE_REGISTER_HOLDING,
     CALL_TYPE_REGISTER_INPUT,
     CALL_TYPE_WRITE_REGISTER,
+    CALL_TYPE_WRITE_REGISTERS,
 )
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.exceptions import ModbusException
 from pymodbus.pdu import ExceptionResponse
 
-from .const import ENUM_MAPPINGS, ENUM_SOURCE_KEYS, READ_REGISTERS
+from .const import (
+    ENUM_SOURCE_KEYS,
+    ENUM_TABLES,
+    READ_REGISTERS,
+    SORTED_READ_REGISTERS,
+)
 
 if TYPE_CHECKING:
     from homeassistant.components.modbus.modbus import ModbusHub as HAModbusHub
 
 LOGGER = logging.getLogger(__name__)
 
+# FC03/FC04 allow at most 125 registers per request; stay a little under.
+MAX_READ_REGISTERS = 120
+
+# Cooldown for write-triggered refreshes: long enough to collapse a
+# burst of control edits into one poll, short enough to feel instant.
+REQUEST_REFRESH_COOLDOWN_SECONDS = 0.35
+
 MODBUS_EXCEPTION_LABELS: dict[int, str] = {
     1: "illegal function",
     2: "illegal data address",
@@ -31,10 +47,55 @@ MODBUS_EXCEPTION_LABELS: dict[int, str] = {
     4: "server device failure",
 }
 
+# Message templates shared by all failure sites; only ever formatted on
+# an actual error, never on the happy path.
+_REJECTED_VALUE_TEMPLATE = (
+    "Device rejected value (%s) on slave=%s: %s. "
+    "Check allowed range and required operating mode."
+)
+_PROTOCOL_ERROR_TEMPLATE = "Modbus protocol error (%s) on slave=%s: %s"
+
+
+def _non_retryable_error(
+    response: ExceptionResponse, slave_id: int, action: str
+) -> NonRetryableModbusException:
+    """Convert a Modbus exception response into an explicit user-facing error."""
+    code = int(getattr(response, "exception_code", -1))
+    label = MODBUS_EXCEPTION_LABELS.get(code, f"exception code {code}")
+    if code == 3:
+        return NonRetryableModbusException(
+            _REJECTED_VALUE_TEMPLATE % (label, slave_id, action)
+        )
+    return NonRetryableModbusException(
+        _PROTOCOL_ERROR_TEMPLATE % (label, slave_id, action)
+    )
+_SHORT_READ_TEMPLATE = "Expected %s registers but got %s"
+
 
 class NonRetryableModbusException(ModbusException):
     """A device-side protocol error where retrying the same request is pointless."""
 
+    __slots__ = ()
+
+
+class _ConnectionPair:
+    """Read/write client pair shared by all hubs targeting one (host, port)."""
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        # Use separate clients for read and write so controls are not blocked
+        # behind long polling reads.
+        self.read_client = AsyncModbusTcpClient(host=host, port=port, timeout=timeout)
+        self.write_client = AsyncModbusTcpClient(host=host, port=port, timeout=timeout)
+        self.read_lock = asyncio.Lock()
+        self.write_lock = asyncio.Lock()
+        self.refcount = 0
+
+
+# Modbus TCP gateways fronting several RTU slaves often allow only a few
+# concurrent connections, so hubs for different slave ids on the same
+# target multiplex over one pooled connection pair.
+_CONNECTION_POOL: dict[tuple[str, int], _ConnectionPair] = {}
+
 
 class BWWPModbusHub:
     """Thin async wrapper around pymodbus TCP client."""
@@ -44,12 +105,28 @@ class BWWPModbusHub:
         self._port = port
         self._slave_id = slave_id
         self._timeout = timeout
-        # Use separate clients for read and write so controls are not blocked
-        # behind long polling reads.
-        self._read_client = AsyncModbusTcpClient(host=host, port=port, timeout=timeout)
-        self._write_client = AsyncModbusTcpClient(host=host, port=port, timeout=timeout)
-        self._read_lock = asyncio.Lock()
-        self._write_lock = asyncio.Lock()
+        pool_key = (host, int(port))
+        pair = _CONNECTION_POOL.get(pool_key)
+        if pair is None:
+            pair = _CONNECTION_POOL[pool_key] = _ConnectionPair(host, port, timeout)
+        pair.refcount += 1
+        # Conservative devices can lower this (e.g. to 32) without code
+        # changes; reads above the limit are split automatically.
+        self.max_read_registers = MAX_READ_REGISTERS
+        # Name of the slave-id kwarg ("device_id" on current pymodbus,
+        # "slave" on older releases); resolved on the first request.
+        self._slave_kwarg: str | None = None
+        # Whether this pymodbus client exposes .connected; checked once
+        # instead of a getattr-with-default per request.
+        self._has_connected_attr = hasattr(pair.read_client, "connected")
+        # Consecutive failed calls; drives the reconnect backoff.
+        self._consecutive_failures = 0
+        self._pool_key = pool_key
+        self._pair = pair
+        self._read_client = pair.read_client
+        self._write_client = pair.write_client
+        self._read_lock = pair.read_lock
+        self._write_lock = pair.write_lock
 
     @property
     def host(self) -> str:
@@ -64,28 +141,59 @@ class BWWPModbusHub:
         return self._slave_id
 
     async def async_close(self) -> None:
-        """Close network connection."""
+        """Release the pooled connection, closing it with the last user."""
+        self._pair.refcount -= 1
+        if self._pair.refcount > 0:
+            return
+        _CONNECTION_POOL.pop(self._pool_key, None)
         self._read_client.close()
         self._write_client.close()
 
-    @staticmethod
-    def _is_connected(client: AsyncModbusTcpClient) -> bool:
-        return bool(getattr(client, "connected", False))
+    def _is_connected(self, client: AsyncModbusTcpClient) -> bool:
+        return bool(client.connected) if self._has_connected_attr else False
 
     async def _ensure_connection(self, client: AsyncModbusTcpClient) -> None:
         if self._is_connected(client):
             return
-        connected = await asyncio.wait_for(
-            client.connect(), timeout=self._request_timeout()
-        )
+        async with asyncio.timeout(self._request_timeout()):
+            connected = await client.connect()
         if not connected:
             raise ModbusException(
                 f"Unable to connect to Modbus target {self._host}:{self._port}"
             )
+        self._tune_socket(client)
+
+    @staticmethod
+    def _tune_socket(client: AsyncModbusTcpClient) -> None:
+        """Disable Nagle and enable keepalive on a fresh connection.
+
+        TCP_NODELAY keeps small Modbus ADUs from being held back for
+        coalescing; SO_KEEPALIVE lets the OS detect half-dead gateways
+        instead of the next poll timing out.
+        """
+        transport = getattr(client, "transport", None)
+        sock = transport.get_extra_info("socket") if transport else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass
 
     async def _reset_connection(self, client: AsyncModbusTcpClient) -> None:
-        """Close current connection so next call forces reconnect."""
+        """Recover from a failed call, reconnecting only when it persists.
+
+        A single transient error retries on the live socket - a fresh
+        TCP handshake costs more than the retry. Repeated failures close
+        the connection and back off exponentially (1s..8s) so a flaky
+        link does not churn SYN/FIN exchanges.
+        """
+        self._consecutive_failures += 1
+        if self._consecutive_failures < 2:
+            return
         client.close()
+        await asyncio.sleep(min(2 ** (self._consecutive_failures - 2), 8))
 
     def _request_timeout(self) -> float:
         """Hard upper bound for one network call to avoid hanging tasks."""
@@ -94,48 +202,75 @@ class BWWPModbusHub:
     async def async_read_registers(
         self, register_type: str, address: int, count: int
     ) -> list[int]:
-        """Read multiple contiguous registers."""
+        """Read multiple contiguous registers, chunked to the FC03 limit."""
         if count < 1:
             return []
 
+        limit = max(1, int(self.max_read_registers))
         async with self._read_lock:
-            last_error: Exception | None = None
-            for attempt in range(2):
-                try:
-                    await self._ensure_connection(self._read_client)
-                    if register_type == "holding":
-                        result = await self._async_read_holding_registers(
-                            self._read_client, address, count
-                        )
-                    else:
-                        result = await self._async_read_input_registers(
-                            self._read_client, address, count
-                        )
+            if count <= limit:
+                return await self._async_read_block_locked(
+                    register_type, address, count
+                )
+            values: list[int] = []
+            for start in range(address, address + count, limit):
+                sub_count = min(limit, address + count - start)
+                values.extend(
+                    await self._async_read_block_locked(
+                        register_type, start, sub_count
+                    )
+                )
+            return values
 
-                    if not result.isError():
-                        registers = getattr(result, "registers", None) or []
-                        if len(registers) < count:
-                            raise ModbusException(
-                                f"Expected {count} registers but got {len(registers)}"
-                            )
-                        return [int(value) for value in registers[:count]]
+    async def _async_read_block_locked(
+        self, register_type: str, address: int, count: int
+    ) -> list[int]:
+        """Read one block of registers; caller holds the read lock."""
+        last_error: Exception | None = None
+        for attempt in range(2):
+            try:
+                await self._ensure_connection(self._read_client)
+                if register_type == "holding":
+                    result = await self._async_read_holding_registers(
+                        self._read_client, address, count
+                    )
+                else:
+                    result = await self._async_read_input_registers(
+                        self._read_client, address, count
+                    )
 
-                    if isinstance(result, ExceptionResponse):
-                        raise self._build_non_retryable_error(
-                            response=result,
-                            action=f"read {register_type} addr={address} count={count}",
+                # Protocol-level exception responses come first: the device
+                # answered, so neither a retry nor a connection reset can
+                # change the outcome.
+                if isinstance(result, ExceptionResponse):
+                    raise self._build_non_retryable_error(
+                        response=result,
+                        action=f"read {register_type} addr={address} count={count}",
+                    )
+
+                if not result.isError():
+                    registers = getattr(result, "registers", None) or []
+                    if len(registers) < count:
+                        raise ModbusException(
+                            _SHORT_READ_TEMPLATE % (count, len(registers))
                         )
+                    self._consecutive_failures = 0
+                    # pymodbus already returns a list[int]; avoid the
+                    # slice + int() comprehension on the happy path.
+                    if len(registers) == count:
+                        return registers
+                    return registers[:count]
 
-                    last_error = ModbusException(str(result))
-                except NonRetryableModbusException:
-                    raise
-                except (OSError, asyncio.TimeoutError, ModbusException) as err:
-                    last_error = err
+                last_error = ModbusException(str(result))
+            except NonRetryableModbusException:
+                raise
+            except (OSError, asyncio.TimeoutError, ModbusException) as err:
+                last_error = err
 
-                if attempt == 0:
-                    await self._reset_connection(self._read_client)
+            if attempt == 0:
+                await self._reset_connection(self._read_client)
 
-            raise last_error or ModbusException("Unknown Modbus read error")
+        raise last_error or ModbusException("Unknown Modbus read error")
 
     async def async_read_register(self, register_type: str, address: int) -> int:
         """Read one register (holding or input)."""
@@ -153,15 +288,51 @@ class BWWPModbusHub:
                     result = await self._async_write_holding_register(
                         self._write_client, address, write_value
                     )
+                    if isinstance(result, ExceptionResponse):
+                        raise self._build_non_retryable_error(
+                            response=result,
+                            action=f"write addr={address} value={write_value}",
+                        )
+
                     if not result.isError():
+                        self._consecutive_failures = 0
                         return
 
+                    last_error = ModbusException(str(result))
+                except NonRetryableModbusException:
+                    raise
+                except (OSError, asyncio.TimeoutError, ModbusException) as err:
+                    last_error = err
+
+                if attempt == 0:
+                    await self._reset_connection(self._write_client)
+
+            raise last_error or ModbusException("Unknown Modbus write error")
+
+    async def async_write_registers(self, address: int, values: list[int]) -> None:
+        """Write multiple contiguous holding registers in one FC16 request."""
+        write_values = [value & 0xFFFF for value in values]
+        if not write_values:
+            return
+
+        async with self._write_lock:
+            last_error: Exception | None = None
+            for attempt in range(2):
+                try:
+                    await self._ensure_connection(self._write_client)
+                    result = await self._async_write_holding_registers(
+                        self._write_client, address, write_values
+                    )
                     if isinstance(result, ExceptionResponse):
                         raise self._build_non_retryable_error(
                             response=result,
-                            action=f"write addr={address} value={write_value}",
+                            action=f"write addr={address} values={write_values}",
                         )
 
+                    if not result.isError():
+                        self._consecutive_failures = 0
+                        return
+
                     last_error = ModbusException(str(result))
                 except NonRetryableModbusException:
                     raise
@@ -173,89 +344,64 @@ class BWWPModbusHub:
 
             raise last_error or ModbusException("Unknown Modbus write error")
 
+    async def _async_pymodbus_call(self, func, **kwargs):
+        """Call a pymodbus client method with API compatibility.
+
+        Resolves whether this pymodbus release takes the slave id as
+        ``device_id`` or ``slave`` on the first call, then dispatches
+        directly without the per-call TypeError trampoline. The
+        asyncio.timeout context cancels in place instead of spawning the
+        extra task asyncio.wait_for needs.
+        """
+        if self._slave_kwarg is None:
+            try:
+                async with asyncio.timeout(self._request_timeout()):
+                    result = await func(**kwargs, device_id=self._slave_id)
+            except TypeError:
+                self._slave_kwarg = "slave"
+            else:
+                self._slave_kwarg = "device_id"
+                return result
+        async with asyncio.timeout(self._request_timeout()):
+            return await func(**kwargs, **{self._slave_kwarg: self._slave_id})
+
     async def _async_read_holding_registers(
         self, client: AsyncModbusTcpClient, address: int, count: int
     ):
-        """Read holding registers with pymodbus API compatibility."""
-        try:
-            return await asyncio.wait_for(
-                client.read_holding_registers(
-                    address=address,
-                    count=count,
-                    device_id=self._slave_id,
-                ),
-                timeout=self._request_timeout(),
-            )
-        except TypeError:
-            return await asyncio.wait_for(
-                client.read_holding_registers(
-                    address=address,
-                    count=count,
-                    slave=self._slave_id,
-                ),
-                timeout=self._request_timeout(),
-            )
+        """Read holding registers."""
+        return await self._async_pymodbus_call(
+            client.read_holding_registers, address=address, count=count
+        )
 
     async def _async_read_input_registers(
         self, client: AsyncModbusTcpClient, address: int, count: int
     ):
-        """Read input registers with pymodbus API compatibility."""
-        try:
-            return await asyncio.wait_for(
-                client.read_input_registers(
-                    address=address,
-                    count=count,
-                    device_id=self._slave_id,
-                ),
-                timeout=self._request_timeout(),
-            )
-        except TypeError:
-            return await asyncio.wait_for(
-                client.read_input_registers(
-                    address=address,
-                    count=count,
-                    slave=self._slave_id,
-                ),
-                timeout=self._request_timeout(),
-            )
+        """Read input registers."""
+        return await self._async_pymodbus_call(
+            client.read_input_registers, address=address, count=count
+        )
 
     async def _async_write_holding_register(
         self, client: AsyncModbusTcpClient, address: int, value: int
     ):
-        """Write one holding register with pymodbus API compatibility."""
-        try:
-            return await asyncio.wait_for(
-                client.write_register(
-                    address=address,
-                    value=value,
-                    device_id=self._slave_id,
-                ),
-                timeout=self._request_timeout(),
-            )
-        except TypeError:
-            return await asyncio.wait_for(
-                client.write_register(
-                    address=address,
-                    value=value,
-                    slave=self._slave_id,
-                ),
-                timeout=self._request_timeout(),
-            )
+        """Write one holding register."""
+        return await self._async_pymodbus_call(
+            client.write_register, address=address, value=value
+        )
+
+    async def _async_write_holding_registers(
+        self, client: AsyncModbusTcpClient, address: int, values: list[int]
+    ):
+        """Write multiple holding registers."""
+        return await self._async_pymodbus_call(
+            client.write_registers, address=address, values=values
+        )
 
     def _build_non_retryable_error(
         self, response: ExceptionResponse, action: str
     ) -> NonRetryableModbusException:
         """Convert Modbus exception responses into explicit user-facing errors."""
-        code = int(getattr(response, "exception_code", -1))
-        label = MODBUS_EXCEPTION_LABELS.get(code, f"exception code {code}")
-        if code == 3:
-            return NonRetryableModbusException(
-                f"Device rejected value ({label}) on slave={self._slave_id}: {action}. "
-                "Check allowed range and required operating mode."
-            )
-        return NonRetryableModbusException(
-            f"Modbus protocol error ({label}) on slave={self._slave_id}: {action}"
-        )
+        return _non_retryable_error(response, self._slave_id, action)
 
 
 class BWWPSharedModbusHub:
@@ -265,21 +411,25 @@ class BWWPSharedModbusHub:
         self._hub = hub
         self._hub_name = hub_name
         self._slave_id = slave_id
+        self.max_read_registers = MAX_READ_REGISTERS
+        # Connection parameters never change for the lifetime of a HA hub,
+        # so resolve them once instead of probing _pb_params per access.
+        params = getattr(hub, "_pb_params", {})
+        host = params.get("host")
+        self._host = str(host).strip() if host is not None else None
+        port = params.get("port")
+        try:
+            self._port = int(port) if port is not None else None
+        except (TypeError, ValueError):
+            self._port = None
 
     @property
     def host(self) -> str | None:
-        params = getattr(self._hub, "_pb_params", {})
-        host = params.get("host")
-        return str(host) if host is not None else None
+        return self._host
 
     @property
     def port(self) -> int | None:
-        params = getattr(self._hub, "_pb_params", {})
-        port = params.get("port")
-        try:
-            return int(port) if port is not None else None
-        except (TypeError, ValueError):
-            return None
+        return self._port
 
     @property
     def slave_id(self) -> int:
@@ -293,6 +443,24 @@ class BWWPSharedModbusHub:
         self, register_type: str, address: int, count: int
     ) -> list[int]:
         """Read multiple contiguous registers through HA modbus hub."""
+        if count < 1:
+            return []
+
+        limit = max(1, int(self.max_read_registers))
+        if count <= limit:
+            return await self._async_read_block(register_type, address, count)
+        values: list[int] = []
+        for start in range(address, address + count, limit):
+            sub_count = min(limit, address + count - start)
+            values.extend(
+                await self._async_read_block(register_type, start, sub_count)
+            )
+        return values
+
+    async def _async_read_block(
+        self, register_type: str, address: int, count: int
+    ) -> list[int]:
+        """Read one block of registers within the FC03/FC04 size limit."""
         call_type = (
             CALL_TYPE_REGISTER_HOLDING
             if register_type == "holding"
@@ -309,9 +477,11 @@ class BWWPSharedModbusHub:
         registers = getattr(result, "registers", None) or []
         if len(registers) < count:
             raise ModbusException(
-                f"Expected {count} registers but got {len(registers)}"
+                _SHORT_READ_TEMPLATE % (count, len(registers))
             )
-        return [int(value) for value in registers[:count]]
+        if len(registers) == count:
+            return registers
+        return registers[:count]
 
     async def async_read_register(self, register_type: str, address: int) -> int:
         """Read one register through HA modbus hub."""
@@ -331,6 +501,35 @@ class BWWPSharedModbusHub:
             raise ModbusException(
                 f"Write failed for hub={self._hub_name} slave={self._slave_id} address={address}"
             )
+        if isinstance(result, ExceptionResponse):
+            raise _non_retryable_error(
+                result, self._slave_id, f"write addr={address} value={write_value}"
+            )
+        if hasattr(result, "isError") and result.isError():
+            raise ModbusException(str(result))
+
+    async def async_write_registers(self, address: int, values: list[int]) -> None:
+        """Write multiple contiguous holding registers through HA modbus hub."""
+        write_values = [value & 0xFFFF for value in values]
+        if not write_values:
+            return
+        result = await self._hub.async_pb_call(
+            self._slave_id,
+            address,
+            write_values,
+            CALL_TYPE_WRITE_REGISTERS,
+        )
+        if result is None:
+            raise ModbusException(
+                f"Write failed for hub={self._hub_name} slave={self._slave_id} address={address}"
+            )
+        # Classify device-sent exception responses like BWWPModbusHub
+        # does, so callers can tell a rejected FC16 apart from a
+        # transport failure and fall back to single writes.
+        if isinstance(result, ExceptionResponse):
+            raise _non_retryable_error(
+                result, self._slave_id, f"write addr={address} values={write_values}"
+            )
         if hasattr(result, "isError") and result.isError():
             raise ModbusException(str(result))
 
@@ -349,86 +548,120 @@ class BWWPDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             LOGGER,
             name="Wolf FHS280",
             update_interval=timedelta(seconds=scan_interval_seconds),
+            # Collapse bursts of async_request_refresh calls (one per
+            # write) into a single poll after the cooldown.
+            request_refresh_debouncer=Debouncer(
+                hass,
+                LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN_SECONDS,
+                immediate=False,
+            ),
         )
         self.hub = hub
+        # Index into _READ_PLANS; advances only after a successful poll
+        # so a restart after failures begins with a full read.
+        self._tick = 0
+        # Bumped whenever data is replaced; entities use it to cache
+        # derived state until the snapshot actually changes.
+        self.data_version = 0
+        # Filtered plans per (needed keys, phase); the handful of
+        # listener-set combinations an install produces is tiny.
+        self._plan_cache: dict[tuple[frozenset[str], int], Any] = {}
+        # Set by write paths: the next poll must re-read everything so
+        # slow-cadence registers that were just written come back fresh
+        # instead of carrying their pre-write value for up to a period.
+        self.force_full_poll = False
+
+    def async_set_updated_data(self, data: dict[str, Any]) -> None:
+        """Replace coordinator data (optimistic local updates)."""
+        self.data_version += 1
+        super().async_set_updated_data(data)
 
     async def _async_update_data(self) -> dict[str, Any]:
         data: dict[str, Any] = {}
         failed_reads = 0
 
-        by_type: dict[str, list[Any]] = {"holding": [], "input": []}
-        for definition in READ_REGISTERS:
-            by_type[definition.register_type].append(definition)
+        previous = self.data
+        if self.force_full_poll or not previous:
+            phase = 0
+            self.force_full_poll = False
+        else:
+            phase = self._tick % _PLAN_PERIOD
+        needed = self._needed_raw_keys()
+        if needed is None:
+            plan, polled_count, carry_keys = _READ_PLANS[phase]
+        else:
+            cache_key = (needed, phase)
+            cached_plan = self._plan_cache.get(cache_key)
+            if cached_plan is None:
+                cached_plan = self._plan_cache[cache_key] = _build_read_plan(
+                    phase, needed
+                )
+            plan, polled_count, carry_keys = cached_plan
+
+        # Blocks of different register types are independent requests;
+        # issue them concurrently so the poll completes in one block's
+        # round-trip time where the hub allows it.
+        results = await asyncio.gather(
+            *(
+                self.hub.async_read_registers(
+                    register_type=register_type,
+                    address=block_start,
+                    count=block_count,
+                )
+                for register_type, block_start, block_count, _, _ in plan
+            ),
+            return_exceptions=True,
+        )
 
-        for register_type, definitions in by_type.items():
-            definitions.sort(key=lambda item: item.address)
-            for block in _contiguous_blocks(definitions):
-                block_start = block[0].address
-                block_count = block[-1].address - block_start + 1
-                try:
-                    raw_values = await self.hub.async_read_registers(
-                        register_type=register_type,
-                        address=block_start,
-                        count=block_count,
-                    )
-                except ModbusException as err:
+        for plan_entry, result in zip(plan, results):
+            register_type, block_start, block_count, block, decode_ops = plan_entry
+            if isinstance(result, ModbusException):
+                if LOGGER.isEnabledFor(logging.DEBUG):
                     LOGGER.debug(
                         "Block read failed (%s @ %s len %s): %s",
                         register_type,
                         block_start,
                         block_count,
-                        err,
+                        result,
                     )
-                    for definition in block:
-                        try:
-                            raw = await self.hub.async_read_register(
-                                register_type=definition.register_type,
-                                address=definition.address,
-                            )
-                        except ModbusException as single_err:
-                            failed_reads += 1
-                            LOGGER.debug(
-                                "Read failed (%s @ %s): %s",
-                                definition.key,
-                                definition.address,
-                                single_err,
-                            )
-                            data[definition.key] = None
-                        else:
-                            _store_scaled_value(data, definition, raw)
-                    continue
-
-                for definition in block:
-                    raw = raw_values[definition.address - block_start]
-                    _store_scaled_value(data, definition, raw)
-
-        if failed_reads == len(READ_REGISTERS):
+                failed_reads += await self._async_read_block_singly(data, block)
+                continue
+            if isinstance(result, BaseException):
+                raise result
+
+            for key, offset, decode in decode_ops:
+                data[key] = decode(result[offset])
+
+        if polled_count and failed_reads == polled_count:
             raise UpdateFailed("No register could be read from BWWP")
 
-        for enum_key, source_key in ENUM_SOURCE_KEYS.items():
+        # Registers not due this cycle keep their last known value; on
+        # the very first poll there is nothing to carry yet and the
+        # listener-narrowed plan may legitimately skip keys.
+        if carry_keys and previous:
+            for key in carry_keys:
+                data[key] = previous.get(key)
+
+        for enum_key, source_key, table in _ENUM_PLAN:
             raw_value = data.get(source_key)
             if raw_value is None:
                 data[enum_key] = "Unknown"
                 continue
 
-            mapping = ENUM_MAPPINGS[enum_key]
-            data[enum_key] = mapping.get(int(raw_value), "Unknown")
+            code = int(raw_value)
+            label = table[code] if 0 <= code < len(table) else None
+            data[enum_key] = label if label is not None else "Unknown"
 
         kompressor_raw = data.get("kompressor_raw")
         heizstab_raw = data.get("heizstab_raw")
         if kompressor_raw is None and heizstab_raw is None:
             data["betriebsstatus"] = "Unknown"
         else:
-            kompressor_on = kompressor_raw is not None and int(kompressor_raw) == 1
-            heizstab_on = heizstab_raw is not None and int(heizstab_raw) == 1
-            if kompressor_on and heizstab_on:
-                data["betriebsstatus"] = "W\u00e4rmepumpe + Heizstab"
-            elif heizstab_on:
-                data["betriebsstatus"] = "Heizstab"
-            elif kompressor_on:
-                data["betriebsstatus"] = "W\u00e4rmepumpe"
-            else:
-                data["betriebsstatus"] = "Aus"
+            index = (
+                (int(kompressor_raw or 0) == 1) << 1
+            ) | (int(heizstab_raw or 0) == 1)
+            data["betriebsstatus"] = _BETRIEBSSTATUS_TABLE[index]
 
         current_h = data.get("current_h")
         current_min = data.get("current_min")
@@ -444,31 +677,125 @@ class BWWPDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         else:
             data["device_time"] = None
 
+        self._tick = phase + 1
+        self.data_version += 1
         return data
 
+    def _needed_raw_keys(self) -> frozenset[str] | None:
+        """Raw register keys with at least one active listener.
+
+        Returns None - meaning read everything - when no listeners are
+        registered yet, when a listener did not declare its keys, or
+        when the declared keys already cover the full register map.
+        """
+        keys: set[str] = set()
+        saw_context = False
+        for context in self.async_contexts():
+            saw_context = True
+            if not isinstance(context, frozenset):
+                return None
+            keys.update(context)
+        if not saw_context:
+            return None
+        needed = frozenset(keys & _ALL_READ_KEYS)
+        if needed == _ALL_READ_KEYS:
+            return None
+        return needed
+
+    async def _async_read_block_singly(
+        self, data: dict[str, Any], block: tuple[Any, ...]
+    ) -> int:
+        """Fall back to per-register reads for one failed block.
+
+        Returns the number of registers that still could not be read.
+        """
+        failed = 0
+        for definition in block:
+            try:
+                raw = await self.hub.async_read_register(
+                    register_type=definition.register_type,
+                    address=definition.address,
+                )
+            except ModbusException as err:
+                failed += 1
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    LOGGER.debug(
+                        "Read failed (%s @ %s): %s",
+                        definition.key,
+                        definition.address,
+                        err,
+                    )
+                data[definition.key] = None
+            else:
+                _store_scaled_value(data, definition, raw)
+        return failed
+
+
+# Derived operating status indexed by (kompressor_on << 1) | heizstab_on,
+# replacing the four-way if/elif chain with a single table lookup.
+_BETRIEBSSTATUS_TABLE: tuple[str, str, str, str] = (
+    "Aus",
+    "Heizstab",
+    "W\u00e4rmepumpe",
+    "W\u00e4rmepumpe + Heizstab",
+)
+
 
 def _to_signed_int16(value: int) -> int:
-    """Convert unsigned register value to signed int16."""
-    if value > 0x7FFF:
-        return value - 0x10000
-    return value
+    """Convert unsigned register value to signed int16 (branchless)."""
+    return (value ^ 0x8000) - 0x8000
+
+
+def _make_decoder(definition):
+    """Build the raw-to-state decode function for one register.
+
+    The scale/precision branches are resolved here, once per definition
+    at import, so the per-poll decode is a single closure call.
+    """
+    scale = definition.scale
+    precision = definition.precision
+    if scale == 1.0 and precision is None:
+        return _to_signed_int16
+
+    if precision is None:
+
+        def decode(raw: int) -> float:
+            return _to_signed_int16(raw) * scale
+
+        return decode
+
+    def decode_rounded(raw: int) -> float:
+        return round(_to_signed_int16(raw) * scale, precision)
+
+    return decode_rounded
+
+
+_DECODERS: dict[str, Any] = {
+    definition.key: _make_decoder(definition) for definition in READ_REGISTERS
+}
+
+# (enum_key, source_key, decode table) resolved once; the poll loop then
+# avoids re-walking ENUM_SOURCE_KEYS.items() and the table dict per cycle.
+_ENUM_PLAN: tuple[tuple[str, str, tuple[str | None, ...]], ...] = tuple(
+    (enum_key, source_key, ENUM_TABLES[enum_key])
+    for enum_key, source_key in ENUM_SOURCE_KEYS.items()
+)
 
 
 def _store_scaled_value(data: dict[str, Any], definition, raw: int) -> None:
-    """Apply scaling/precision and write to coordinator state."""
-    signed_value = _to_signed_int16(raw)
-    scaled_value = signed_value * definition.scale
-    if definition.precision is not None:
-        scaled_value = round(scaled_value, definition.precision)
+    """Decode raw register value and write to coordinator state."""
+    data[definition.key] = _DECODERS[definition.key](raw)
 
-    if definition.scale == 1.0 and definition.precision is None:
-        data[definition.key] = int(scaled_value)
-    else:
-        data[definition.key] = scaled_value
 
+def _contiguous_blocks(
+    definitions: list[Any], max_gap: int = 4, max_block: int = 120
+) -> list[list[Any]]:
+    """Split register definitions into address blocks for batched reads.
 
-def _contiguous_blocks(definitions: list[Any]) -> list[list[Any]]:
-    """Split register definitions into contiguous address blocks."""
+    Blocks separated by at most ``max_gap`` unused registers are merged
+    into one request (the filler words are read and discarded), as long
+    as the merged span stays within ``max_block`` registers.
+    """
     if not definitions:
         return []
 
@@ -476,7 +803,10 @@ def _contiguous_blocks(definitions: list[Any]) -> list[list[Any]]:
     current: list[Any] = [definitions[0]]
 
     for definition in definitions[1:]:
-        if definition.address == current[-1].address + 1:
+        if (
+            definition.address - current[-1].address - 1 <= max_gap
+            and definition.address - current[0].address + 1 <= max_block
+        ):
             current.append(definition)
             continue
         blocks.append(current)
@@ -485,3 +815,65 @@ def _contiguous_blocks(definitions: list[Any]) -> list[list[Any]]:
     blocks.append(current)
     return blocks
 
+
+def _build_read_plan(phase: int, needed: frozenset[str] | None = None) -> tuple[
+    tuple[
+        tuple[str, int, int, tuple[Any, ...], tuple[tuple[str, int, Any], ...]], ...
+    ],
+    int,
+    tuple[str, ...],
+]:
+    """Precompute one polling phase: blocks, polled count, carried keys.
+
+    READ_REGISTERS is immutable at import time, so the grouping, sorting
+    and block splitting happens once here instead of every poll. Each
+    block carries its (key, offset, decoder) triples so decoding a
+    successful block is a flat loop with no attribute or dict lookups.
+    Registers whose ``poll_every`` cadence is not due in ``phase`` are
+    left out of the blocks and returned as carry keys; the poll copies
+    their previous value forward instead of re-reading them. When
+    ``needed`` is given, registers outside it are treated the same way
+    (nobody is listening for them).
+    """
+    plan: list[
+        tuple[str, int, int, tuple[Any, ...], tuple[tuple[str, int, Any], ...]]
+    ] = []
+    polled = 0
+    carried: list[str] = []
+    for register_type, definitions in SORTED_READ_REGISTERS.items():
+        due = [
+            d
+            for d in definitions
+            if phase % d.poll_every == 0 and (needed is None or d.key in needed)
+        ]
+        due_keys = {d.key for d in due}
+        carried.extend(d.key for d in definitions if d.key not in due_keys)
+        polled += len(due)
+        for block in _contiguous_blocks(due):
+            block_start = block[0].address
+            plan.append(
+                (
+                    register_type,
+                    block_start,
+                    block[-1].address - block_start + 1,
+                    tuple(block),
+                    tuple(
+                        (
+                            definition.key,
+                            definition.address - block_start,
+                            _DECODERS[definition.key],
+                        )
+                        for definition in block
+                    ),
+                )
+            )
+    return tuple(plan), polled, tuple(carried)
+
+
+# The polling pattern repeats every lcm(poll_every) cycles; one plan per
+# phase, built once. Phase 0 always reads everything.
+_PLAN_PERIOD = math.lcm(*(definition.poll_every for definition in READ_REGISTERS))
+_READ_PLANS = tuple(_build_read_plan(phase) for phase in range(_PLAN_PERIOD))
+
+_ALL_READ_KEYS = frozenset(definition.key for definition in READ_REGISTERS)
+
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import asyncio
+from collections import ChainMap
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -11,9 +11,40 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from homeassistant.const import CONF_HOST
 
-from .const import CONF_NAME, DEFAULT_NAME, DOMAIN
+from .const import CONF_NAME, DEFAULT_NAME, DERIVED_SOURCE_KEYS, DOMAIN
 from .coordinator import BWWPDataUpdateCoordinator
 
+# One DeviceInfo per config entry, shared by every entity the entry
+# creates; resolving the host/name config chains per entity multiplies
+# identical work across all platforms. Invalidated on options change
+# and unload via pop_cached_device_info.
+_DEVICE_INFO_CACHE: dict[str, DeviceInfo] = {}
+
+
+def pop_cached_device_info(entry_id: str) -> None:
+    """Drop the cached DeviceInfo for an entry."""
+    _DEVICE_INFO_CACHE.pop(entry_id, None)
+
+
+def _device_info_for_entry(
+    entry: ConfigEntry, coordinator: BWWPDataUpdateCoordinator
+) -> DeviceInfo:
+    info = _DEVICE_INFO_CACHE.get(entry.entry_id)
+    if info is None:
+        cfg = ChainMap(entry.options, entry.data)
+        host_value = cfg.get(CONF_HOST, coordinator.hub.host)
+        host = str(host_value).strip() if host_value else ""
+        name = cfg.get(CONF_NAME, DEFAULT_NAME)
+        info = _DEVICE_INFO_CACHE[entry.entry_id] = DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=name,
+            manufacturer="WOLF",
+            model="FHS 280",
+            configuration_url=f"http://{host}" if host else None,
+            sw_version=None,
+        )
+    return info
+
 
 class BWWPBaseEntity(CoordinatorEntity[BWWPDataUpdateCoordinator]):
     """Base entity for all BWWP platforms."""
@@ -25,39 +56,39 @@ class BWWPBaseEntity(CoordinatorEntity[BWWPDataUpdateCoordinator]):
         coordinator: BWWPDataUpdateCoordinator,
         entry: ConfigEntry,
         unique_key: str,
+        state_keys: tuple[str, ...] = (),
     ) -> None:
-        super().__init__(coordinator)
+        # Register the raw registers this entity depends on as the
+        # listener context; the coordinator narrows its reads to
+        # registers with at least one active listener.
+        context = None
+        if state_keys:
+            raw_keys: set[str] = set()
+            for key in state_keys:
+                raw_keys.update(DERIVED_SOURCE_KEYS.get(key, (key,)))
+            context = frozenset(raw_keys)
+        super().__init__(coordinator, context=context)
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_{unique_key}"
-
-        host_value = entry.options.get(
-            CONF_HOST,
-            entry.data.get(CONF_HOST, coordinator.hub.host),
-        )
-        host = str(host_value).strip() if host_value else ""
-        name = entry.options.get(CONF_NAME, entry.data.get(CONF_NAME, DEFAULT_NAME))
-
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=name,
-            manufacturer="WOLF",
-            model="FHS 280",
-            configuration_url=f"http://{host}" if host else None,
-            sw_version=None,
-        )
+        self._attr_device_info = _device_info_for_entry(entry, coordinator)
 
     def _apply_local_update(self, updates: dict[str, Any]) -> None:
         """Update coordinator data immediately so UI reflects writes quickly."""
-        merged = dict(self.coordinator.data or {})
-        merged.update(updates)
+        data = self.coordinator.data
+        # Single C-level merge instead of copy-then-update; listeners
+        # still get a fresh dict so snapshot identity stays meaningful.
+        merged = {**data, **updates} if data else dict(updates)
         self.coordinator.async_set_updated_data(merged)
 
-    def _schedule_background_refresh(self, delay_seconds: float = 0.2) -> None:
-        """Refresh values in background without blocking the service call."""
-
-        async def _refresh_later() -> None:
-            if delay_seconds > 0:
-                await asyncio.sleep(delay_seconds)
-            await self.coordinator.async_request_refresh()
+    def _schedule_background_refresh(self) -> None:
+        """Refresh values in background without blocking the service call.
 
-        self.hass.async_create_task(_refresh_later())
+        The coordinator's request-refresh debouncer collapses a burst
+        of writes into a single poll after its cooldown, so each write
+        just files a request and returns. The poll is forced to a full
+        read: most writable registers are on the slow cadence and must
+        be re-read now to confirm the write.
+        """
+        coordinator = self.coordinator
+        coordinator.force_full_poll = True
+        self.hass.async_create_task(coordinator.async_request_refresh())
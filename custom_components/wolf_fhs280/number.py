@@ -8,7 +8,6 @@ from homeassistant.components.number import NumberEntity, NumberEntityDescriptio
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -16,7 +15,15 @@ from . import RuntimeData
 from .const import DOMAIN
 from .entity import BWWPBaseEntity
 
-WRITE_REFRESH_DELAY_SECONDS = 0.2
+# Writes go through the coordinator-backed hub with its own locking;
+# no per-platform update serialization needed.
+PARALLEL_UPDATES = 0
+
+# Clamp out-of-range writes to the nearest bound instead of raising.
+# UI widgets routinely submit boundary values (slider overshoot,
+# float rounding); clamping skips exception construction and keeps
+# automations that restate a setpoint from failing.
+CLAMP_NUMBER_WRITES = True
 SETPOINT_MIN_C = 5
 SETPOINT_MAX_C = 62
 FALLBACK_SETPOINT_MAX = SETPOINT_MAX_C
@@ -90,8 +97,7 @@ async def async_setup_entry(
     """Set up BWWP number entities."""
     runtime: RuntimeData = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        BWWPNumber(runtime, entry, description)
-        for description in NUMBER_DESCRIPTIONS
+        [BWWPNumber(runtime, entry, description) for description in NUMBER_DESCRIPTIONS]
     )
 
 
@@ -106,15 +112,42 @@ class BWWPNumber(BWWPBaseEntity, NumberEntity):
         entry: ConfigEntry,
         description: BWWPNumberDescription,
     ) -> None:
-        super().__init__(runtime.coordinator, entry, description.key)
+        # The setpoint entity also depends on t_max for its dynamic
+        # maximum, so it must keep that register polled.
+        state_keys = (
+            (description.state_key, "t_max")
+            if description.key == "setpoint_control"
+            else (description.state_key,)
+        )
+        super().__init__(
+            runtime.coordinator, entry, description.key, state_keys=state_keys
+        )
         self.entity_description = description
         self._attr_mode = NumberMode.BOX
         self._attr_suggested_display_precision = 0
         self._hub = runtime.hub
+        # Bound method and register resolved once; the write path then
+        # skips the attribute chains entirely.
+        self._write = runtime.hub.async_write_register
+        self._register = description.register
+        # Descriptions are frozen, so resolve the integer bounds once
+        # instead of converting float attributes on every write.
+        min_value = description.native_min_value
+        max_value = description.native_max_value
+        self._min_int = int(min_value) if min_value is not None else None
+        self._max_int = int(max_value) if max_value is not None else None
+        # The setpoint maximum follows the device's t_max register and
+        # must be re-read per call; all other bounds are static.
+        self._dynamic_max = description.key == "setpoint_control"
+        self._state_key = description.state_key
+        # native_value result, valid while the coordinator snapshot it
+        # was computed from is still current.
+        self._cached_version = -1
+        self._cached_value: float | None = None
 
     @property
     def native_max_value(self) -> float | None:
-        if self.entity_description.key != "setpoint_control":
+        if not self._dynamic_max:
             return self.entity_description.native_max_value
 
         data = self.coordinator.data or {}
@@ -124,32 +157,55 @@ class BWWPNumber(BWWPBaseEntity, NumberEntity):
         except (TypeError, ValueError):
             limit = FALLBACK_SETPOINT_MAX
 
-        min_value = int(float(self.entity_description.native_min_value or SETPOINT_MIN_C))
+        min_value = self._min_int if self._min_int is not None else SETPOINT_MIN_C
         limit = max(min_value, min(limit, SETPOINT_MAX_C))
         return float(limit)
 
     @property
     def native_value(self) -> float | None:
-        data = self.coordinator.data or {}
-        value = data.get(self.entity_description.state_key)
-        if value is None:
-            return None
-        return int(value)
+        coordinator = self.coordinator
+        if coordinator.data_version != self._cached_version:
+            data = coordinator.data
+            value = data.get(self._state_key) if data else None
+            self._cached_value = None if value is None else int(value)
+            self._cached_version = coordinator.data_version
+        return self._cached_value
 
     async def async_set_native_value(self, value: float) -> None:
         rounded_value = int(round(value))
-        min_value = self.native_min_value
-        max_value = self.native_max_value
-        if min_value is not None and rounded_value < int(float(min_value)):
-            raise HomeAssistantError(
-                f"Value {rounded_value} is below minimum {int(float(min_value))}"
-            )
-        if max_value is not None and rounded_value > int(float(max_value)):
-            raise HomeAssistantError(
-                f"Value {rounded_value} is above maximum {int(float(max_value))}"
-            )
-        await self._hub.async_write_register(
-            address=self.entity_description.register,
-            value=rounded_value,
+        min_int = self._min_int
+        max_int = (
+            int(self.native_max_value) if self._dynamic_max else self._max_int
         )
-        self._schedule_background_refresh(WRITE_REFRESH_DELAY_SECONDS)
+        if CLAMP_NUMBER_WRITES:
+            if min_int is not None and rounded_value < min_int:
+                rounded_value = min_int
+            if max_int is not None and rounded_value > max_int:
+                rounded_value = max_int
+        else:
+            # Only the cold out-of-bounds branches need
+            # HomeAssistantError; importing it here keeps it off the
+            # integration setup path.
+            from homeassistant.exceptions import HomeAssistantError
+
+            if min_int is not None and rounded_value < min_int:
+                raise HomeAssistantError(
+                    f"Value {rounded_value} is below minimum {min_int}"
+                )
+            if max_int is not None and rounded_value > max_int:
+                raise HomeAssistantError(
+                    f"Value {rounded_value} is above maximum {max_int}"
+                )
+
+        # Re-confirm clicks and automations often restate the current
+        # value; skip the Modbus round trip and follow-up refresh then.
+        data = self.coordinator.data
+        current = data.get(self._state_key) if data else None
+        if current is not None:
+            try:
+                if int(current) == rounded_value:
+                    return
+            except (TypeError, ValueError):
+                pass
+        await self._write(address=self._register, value=rounded_value)
+        self._schedule_background_refresh()
@@ -12,15 +12,21 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import RuntimeData
 from .const import (
-    BETRIEBSART_OPTIONS,
+    BETRIEBSART_OPTIONS_LABELS,
+    BETRIEBSART_OPTIONS_REV,
     DOMAIN,
-    FERIEN_OPTIONS,
-    LEGIONELLEN_OPTIONS,
-    PV_MODUS_OPTIONS,
+    FERIEN_OPTIONS_LABELS,
+    FERIEN_OPTIONS_REV,
+    LEGIONELLEN_OPTIONS_LABELS,
+    LEGIONELLEN_OPTIONS_REV,
+    PV_MODUS_OPTIONS_LABELS,
+    PV_MODUS_OPTIONS_REV,
 )
 from .entity import BWWPBaseEntity
 
-WRITE_REFRESH_DELAY_SECONDS = 0.2
+# Writes go through the coordinator-backed hub with its own locking;
+# no per-platform update serialization needed.
+PARALLEL_UPDATES = 0
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -38,40 +44,40 @@ SELECT_DESCRIPTIONS: tuple[BWWPSelectDescription, ...] = (
         translation_key="betriebsart_control",
         icon="mdi:cog-transfer",
         entity_category=EntityCategory.CONFIG,
-        options=tuple(BETRIEBSART_OPTIONS.values()),
+        options=BETRIEBSART_OPTIONS_LABELS,
         register=12,
         state_key="betriebsart",
-        options_map={label: code for code, label in BETRIEBSART_OPTIONS.items()},
+        options_map=BETRIEBSART_OPTIONS_REV,
     ),
     BWWPSelectDescription(
         key="legionellen_control",
         translation_key="legionellen_control",
         icon="mdi:bacteria-outline",
         entity_category=EntityCategory.CONFIG,
-        options=tuple(LEGIONELLEN_OPTIONS.values()),
+        options=LEGIONELLEN_OPTIONS_LABELS,
         register=13,
         state_key="legionellen",
-        options_map={label: code for code, label in LEGIONELLEN_OPTIONS.items()},
+        options_map=LEGIONELLEN_OPTIONS_REV,
     ),
     BWWPSelectDescription(
         key="pv_modus_control",
         translation_key="pv_modus_control",
         icon="mdi:solar-power-variant-outline",
         entity_category=EntityCategory.CONFIG,
-        options=tuple(PV_MODUS_OPTIONS.values()),
+        options=PV_MODUS_OPTIONS_LABELS,
         register=17,
         state_key="pv_modus",
-        options_map={label: code for code, label in PV_MODUS_OPTIONS.items()},
+        options_map=PV_MODUS_OPTIONS_REV,
     ),
     BWWPSelectDescription(
         key="ferien_control",
         translation_key="ferien_control",
         icon="mdi:beach",
         entity_category=EntityCategory.CONFIG,
-        options=tuple(FERIEN_OPTIONS.values()),
+        options=FERIEN_OPTIONS_LABELS,
         register=20,
         state_key="ferien",
-        options_map={label: code for code, label in FERIEN_OPTIONS.items()},
+        options_map=FERIEN_OPTIONS_REV,
     ),
 )
 
@@ -84,8 +90,7 @@ async def async_setup_entry(
     """Set up BWWP select entities."""
     runtime: RuntimeData = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        BWWPSelect(runtime, entry, description)
-        for description in SELECT_DESCRIPTIONS
+        [BWWPSelect(runtime, entry, description) for description in SELECT_DESCRIPTIONS]
     )
 
 
@@ -100,23 +105,46 @@ class BWWPSelect(BWWPBaseEntity, SelectEntity):
         entry: ConfigEntry,
         description: BWWPSelectDescription,
     ) -> None:
-        super().__init__(runtime.coordinator, entry, description.key)
+        super().__init__(
+            runtime.coordinator,
+            entry,
+            description.key,
+            state_keys=(description.state_key,),
+        )
         self.entity_description = description
         self._hub = runtime.hub
+        # Bound write method resolved once for the select write path.
+        self._write = runtime.hub.async_write_register
+        # Hash lookup per state read instead of scanning the options tuple.
+        self._valid_options = frozenset(description.options or ())
+        # Frozen-dataclass attribute chains cost two lookups each; the
+        # write path only needs these two values.
+        self._options_map = description.options_map
+        self._register = description.register
+        self._state_key = description.state_key
+        # current_option result, valid while the coordinator snapshot it
+        # was computed from is still current.
+        self._cached_version = -1
+        self._cached_option: str | None = None
 
     @property
     def current_option(self) -> str | None:
-        data = self.coordinator.data or {}
-        value = data.get(self.entity_description.state_key)
-        if value in self.entity_description.options:
-            return value
-        return None
+        coordinator = self.coordinator
+        if coordinator.data_version != self._cached_version:
+            data = coordinator.data
+            value = data.get(self._state_key) if data else None
+            self._cached_option = value if value in self._valid_options else None
+            self._cached_version = coordinator.data_version
+        return self._cached_option
 
     async def async_select_option(self, option: str) -> None:
-        if option not in self.entity_description.options_map:
+        code = self._options_map.get(option)
+        if code is None:
             return
-        await self._hub.async_write_register(
-            address=self.entity_description.register,
-            value=self.entity_description.options_map[option],
-        )
-        self._schedule_background_refresh(WRITE_REFRESH_DELAY_SECONDS)
+        # The coordinator stores the decoded label; selecting the
+        # already-active option needs no write or refresh.
+        data = self.coordinator.data
+        if data and data.get(self._state_key) == option:
+            return
+        await self._write(address=self._register, value=code)
+        self._schedule_background_refresh()
@@ -20,53 +20,38 @@ from . import RuntimeData
 from .const import DOMAIN
 from .entity import BWWPBaseEntity
 
+# Writes go through the coordinator-backed hub with its own locking;
+# no per-platform update serialization needed.
+PARALLEL_UPDATES = 0
+
 
 @dataclass(frozen=True, kw_only=True)
 class BWWPSensorDescription(SensorEntityDescription):
     """Description for one BWWP sensor."""
 
 
-SENSORS: tuple[BWWPSensorDescription, ...] = (
-    BWWPSensorDescription(
-        key="t_pv_wp",
-        translation_key="t_pv_wp",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    BWWPSensorDescription(
-        key="t_pv_el",
-        translation_key="t_pv_el",
+def _temp_sensor(key: str) -> BWWPSensorDescription:
+    """Temperature measurement description; they differ only by key."""
+    return BWWPSensorDescription(
+        key=key,
+        translation_key=key,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
-    ),
+    )
+
+
+SENSORS: tuple[BWWPSensorDescription, ...] = (
+    _temp_sensor("t_pv_wp"),
+    _temp_sensor("t_pv_el"),
     BWWPSensorDescription(
         key="legionellen_tage",
         translation_key="legionellen_tage",
         native_unit_of_measurement=UnitOfTime.DAYS,
     ),
-    BWWPSensorDescription(
-        key="t_max",
-        translation_key="t_max",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    BWWPSensorDescription(
-        key="t1",
-        translation_key="t1",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
-    BWWPSensorDescription(
-        key="t2",
-        translation_key="t2",
-        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        device_class=SensorDeviceClass.TEMPERATURE,
-        state_class=SensorStateClass.MEASUREMENT,
-    ),
+    _temp_sensor("t_max"),
+    _temp_sensor("t1"),
+    _temp_sensor("t2"),
     BWWPSensorDescription(
         key="kompressor",
         translation_key="kompressor",
@@ -104,7 +89,9 @@ async def async_setup_entry(
 ) -> None:
     """Set up BWWP sensors."""
     runtime: RuntimeData = hass.data[DOMAIN][entry.entry_id]
-    async_add_entities(BWWPSensor(runtime, entry, description) for description in SENSORS)
+    async_add_entities(
+        [BWWPSensor(runtime, entry, description) for description in SENSORS]
+    )
 
 
 class BWWPSensor(BWWPBaseEntity, SensorEntity):
@@ -118,10 +105,32 @@ class BWWPSensor(BWWPBaseEntity, SensorEntity):
         entry: ConfigEntry,
         description: BWWPSensorDescription,
     ) -> None:
-        super().__init__(runtime.coordinator, entry, description.key)
+        super().__init__(
+            runtime.coordinator,
+            entry,
+            description.key,
+            state_keys=(description.key,),
+        )
         self.entity_description = description
+        self._state_key = description.key
+        self._last_available = runtime.coordinator.last_update_success
+        self._read_state()
+
+    def _read_state(self) -> None:
+        """Compute state once per coordinator tick, not per HA read."""
+        data = self.coordinator.data
+        self._attr_native_value = data.get(self._state_key) if data else None
 
-    @property
-    def native_value(self):
-        data = self.coordinator.data or {}
-        return data.get(self.entity_description.key)
+    def _handle_coordinator_update(self) -> None:
+        data = self.coordinator.data
+        new_value = data.get(self._state_key) if data else None
+        available = self.coordinator.last_update_success
+        # Most registers are steady between polls; skip the state write
+        # (and the listener fan-out it triggers) only when neither the
+        # value nor availability changed - unavailable transitions must
+        # always be pushed even though the data is identical.
+        if new_value == self._attr_native_value and available == self._last_available:
+            return
+        self._attr_native_value = new_value
+        self._last_available = available
+        super()._handle_coordinator_update()
@@ -14,7 +14,9 @@ from . import RuntimeData
 from .const import DOMAIN
 from .entity import BWWPBaseEntity
 
-WRITE_REFRESH_DELAY_SECONDS = 0.2
+# Writes go through the coordinator-backed hub with its own locking;
+# no per-platform update serialization needed.
+PARALLEL_UPDATES = 0
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -53,8 +55,7 @@ async def async_setup_entry(
     """Set up BWWP switch entities."""
     runtime: RuntimeData = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        BWWPSwitch(runtime, entry, description)
-        for description in SWITCH_DESCRIPTIONS
+        [BWWPSwitch(runtime, entry, description) for description in SWITCH_DESCRIPTIONS]
     )
 
 
@@ -69,28 +70,45 @@ class BWWPSwitch(BWWPBaseEntity, SwitchEntity):
         entry: ConfigEntry,
         description: BWWPSwitchDescription,
     ) -> None:
-        super().__init__(runtime.coordinator, entry, description.key)
+        super().__init__(
+            runtime.coordinator,
+            entry,
+            description.key,
+            state_keys=(description.state_key,),
+        )
         self.entity_description = description
         self._hub = runtime.hub
-
-    @property
-    def is_on(self) -> bool | None:
-        data = self.coordinator.data or {}
-        value = data.get(self.entity_description.state_key)
-        if value is None:
-            return None
-        return int(value) == 1
+        # Bound method and register resolved once, as in number/select.
+        self._write = runtime.hub.async_write_register
+        self._register = description.register
+        self._state_key = description.state_key
+        self._last_available = runtime.coordinator.last_update_success
+        self._read_state()
+
+    def _read_state(self) -> None:
+        """Compute state once per coordinator tick, not per HA read."""
+        data = self.coordinator.data
+        value = data.get(self._state_key) if data else None
+        # Decoders store plain ints, so the value compares directly.
+        self._attr_is_on = None if value is None else value == 1
+
+    def _handle_coordinator_update(self) -> None:
+        data = self.coordinator.data
+        value = data.get(self._state_key) if data else None
+        new_is_on = None if value is None else value == 1
+        available = self.coordinator.last_update_success
+        # Skip the state write only when position and availability are
+        # both unchanged; unavailable transitions must be pushed.
+        if new_is_on == self._attr_is_on and available == self._last_available:
+            return
+        self._attr_is_on = new_is_on
+        self._last_available = available
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self, **kwargs) -> None:
-        await self._hub.async_write_register(
-            address=self.entity_description.register,
-            value=1,
-        )
-        self._schedule_background_refresh(WRITE_REFRESH_DELAY_SECONDS)
+        await self._write(address=self._register, value=1)
+        self._schedule_background_refresh()
 
     async def async_turn_off(self, **kwargs) -> None:
-        await self._hub.async_write_register(
-            address=self.entity_description.register,
-            value=0,
-        )
-        self._schedule_background_refresh(WRITE_REFRESH_DELAY_SECONDS)
+        await self._write(address=self._register, value=0)
+        self._schedule_background_refresh()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import time
+from functools import lru_cache
 
 from homeassistant.components.time import TimeEntity, TimeEntityDescription
 from homeassistant.config_entries import ConfigEntry
@@ -13,9 +14,18 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import RuntimeData
 from .const import DOMAIN
+from .coordinator import NonRetryableModbusException
 from .entity import BWWPBaseEntity
 
-WRITE_REFRESH_DELAY_SECONDS = 0.2
+# Writes go through the coordinator-backed hub with its own locking;
+# no per-platform update serialization needed.
+PARALLEL_UPDATES = 0
+
+
+@lru_cache(maxsize=1440)
+def _mk_time(hour: int, minute: int) -> time:
+    """Shared immutable time objects; the domain has 1440 values."""
+    return time(hour=hour, minute=minute)
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -60,7 +70,7 @@ async def async_setup_entry(
     """Set up BWWP time entities."""
     runtime: RuntimeData = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
-        BWWPTime(runtime, entry, description) for description in TIME_DESCRIPTIONS
+        [BWWPTime(runtime, entry, description) for description in TIME_DESCRIPTIONS]
     )
 
 
@@ -75,37 +85,98 @@ class BWWPTime(BWWPBaseEntity, TimeEntity):
         entry: ConfigEntry,
         description: BWWPTimeDescription,
     ) -> None:
-        super().__init__(runtime.coordinator, entry, description.key)
+        super().__init__(
+            runtime.coordinator,
+            entry,
+            description.key,
+            state_keys=(
+                description.hour_state_key,
+                description.minute_state_key,
+            ),
+        )
         self.entity_description = description
         self._hub = runtime.hub
-
-    @property
-    def native_value(self) -> time | None:
-        data = self.coordinator.data or {}
-        hour_raw = data.get(self.entity_description.hour_state_key)
-        minute_raw = data.get(self.entity_description.minute_state_key)
-        if hour_raw is None or minute_raw is None:
+        self._hour_register = description.hour_register
+        self._minute_register = description.minute_register
+        # Adjacent registers can be written in one FC16 transaction.
+        self._contiguous = (
+            description.minute_register == description.hour_register + 1
+        )
+        self._hour_state_key = description.hour_state_key
+        self._minute_state_key = description.minute_state_key
+        self._last_available = runtime.coordinator.last_update_success
+        self._read_state()
+
+    def _read_state(self) -> None:
+        """Compute state once per coordinator tick, not per HA read."""
+        self._attr_native_value = self._current_time()
+
+    def _current_time(self) -> time | None:
+        data = self.coordinator.data
+        if not data:
             return None
-
-        try:
-            hour = int(hour_raw)
-            minute = int(minute_raw)
-        except (TypeError, ValueError):
+        hour = data.get(self._hour_state_key)
+        minute = data.get(self._minute_state_key)
+        if hour is None or minute is None:
             return None
 
-        if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        # The coordinator stores ints; convert only on the rare path.
+        if type(hour) is not int or type(minute) is not int:
+            try:
+                hour = int(hour)
+                minute = int(minute)
+            except (TypeError, ValueError):
+                return None
+
+        # One sign check covers both values; two upper-bound compares
+        # replace the four chained ones.
+        if (hour | minute) < 0 or hour > 23 or minute > 59:
             return None
-        return time(hour=hour, minute=minute)
+        return _mk_time(hour, minute)
+
+    def _handle_coordinator_update(self) -> None:
+        new_value = self._current_time()
+        available = self.coordinator.last_update_success
+        # Skip the state write only when time and availability are both
+        # unchanged; unavailable transitions must be pushed.
+        if new_value == self._attr_native_value and available == self._last_available:
+            return
+        self._attr_native_value = new_value
+        self._last_available = available
+        super()._handle_coordinator_update()
 
     async def async_set_value(self, value: time) -> None:
         hour = int(value.hour)
         minute = int(value.minute)
+        if self._contiguous:
+            try:
+                # Hour and minute registers are adjacent, so one FC16
+                # request sets the pair in a single Modbus transaction.
+                await self._hub.async_write_registers(
+                    address=self._hour_register,
+                    values=[hour, minute],
+                )
+            except NonRetryableModbusException:
+                # Some gateways reject FC16; fall back to single writes.
+                await self._async_write_singly(hour, minute)
+        else:
+            await self._async_write_singly(hour, minute)
+        # Reflect the new time immediately; the debounced refresh only
+        # confirms it against the device afterwards.
+        self._apply_local_update(
+            {
+                self._hour_state_key: hour,
+                self._minute_state_key: minute,
+            }
+        )
+        self._schedule_background_refresh()
+
+    async def _async_write_singly(self, hour: int, minute: int) -> None:
         await self._hub.async_write_register(
-            address=self.entity_description.hour_register,
+            address=self._hour_register,
             value=hour,
         )
         await self._hub.async_write_register(
-            address=self.entity_description.minute_register,
+            address=self._minute_register,
             value=minute,
         )
-        self._schedule_background_refresh(WRITE_REFRESH_DELAY_SECONDS)